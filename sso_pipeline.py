@@ -5,12 +5,19 @@
 
 from __future__ import annotations
 
+import json
+import os
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import requests
+from pyarrow import csv as pa_csv
 
 # -----------------------------
 # CONFIG
@@ -34,27 +41,139 @@ OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 SEWER_ZIP_PATH = CACHE_DIR / "all_sewer_overflow_and_collection_systems_tables.zip"
 
+# Stream the download in 1 MiB chunks
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Parse CSVs in 16 MiB blocks (one block per reader thread)
+CSV_BLOCK_SIZE = 16 << 20
+
+# Identifier columns shared by both tables. Pinned to strings so values
+# like "001" keep their leading zeros instead of being inferred as ints.
+ID_COLUMN_TYPES = {
+    "permit_identifier": pa.string(),
+    "collection_system_identifier": pa.string(),
+}
+
+# Rows serialized per CSV chunk / Parquet row group when writing outputs
+OUTPUT_CHUNK_ROWS = 500_000
+
+# SSO event timestamps, parsed while reading the CSV
+SSO_DATETIME_COLS = (
+    "sewer_overflow_bypass_start_datetime",
+    "sewer_overflow_bypass_end_datetime",
+)
+
 
 # =========================================================
 # 1. Download & extract SSO tables
 # =========================================================
+def _remote_zip_meta() -> Dict[str, Optional[str]]:
+    """
+    HEAD the EPA ZIP and return its ETag / Content-Length (None if absent).
+    """
+    resp = requests.head(SEWER_ZIP_URL, timeout=30, allow_redirects=True)
+    resp.raise_for_status()
+    return {
+        "etag": resp.headers.get("ETag"),
+        "content_length": resp.headers.get("Content-Length"),
+    }
+
+
+def _cached_zip_is_current() -> bool:
+    """
+    Check the cached ZIP against the server before reusing it.
+
+    The ETag recorded in the sidecar JSON at download time must match the
+    server's, and the file size on disk must match its Content-Length.
+    That catches both upstream updates and truncated downloads. If the
+    server can't be reached, or sends neither header, fall back to checking
+    that the cache is a readable ZIP.
+    """
+    if not SEWER_ZIP_PATH.exists():
+        return False
+
+    try:
+        remote = _remote_zip_meta()
+    except requests.RequestException as exc:
+        print(f"[sso] HEAD failed ({exc}); validating cached ZIP locally")
+        return zipfile.is_zipfile(SEWER_ZIP_PATH)
+
+    if remote["etag"] is None and remote["content_length"] is None:
+        return zipfile.is_zipfile(SEWER_ZIP_PATH)
+
+    meta_path = SEWER_ZIP_PATH.with_suffix(".json")
+    cached = json.loads(meta_path.read_text()) if meta_path.exists() else {}
+
+    if remote["etag"] is not None and cached.get("etag") != remote["etag"]:
+        return False
+    if remote["content_length"] is not None and (
+        SEWER_ZIP_PATH.stat().st_size != int(remote["content_length"])
+    ):
+        return False
+    return True
+
+
 def download_sso_zip(force: bool = False) -> Path:
     """
     Download the sewer overflow / collection system ZIP from EPA
     and save it to CACHE_DIR.
+
+    A cached ZIP is reused only if it still matches the server
+    (see _cached_zip_is_current).
     """
-    if SEWER_ZIP_PATH.exists() and not force:
+    if not force and _cached_zip_is_current():
         print(f"[sso] Using cached ZIP: {SEWER_ZIP_PATH}")
         return SEWER_ZIP_PATH
 
     print(f"[sso] Downloading: {SEWER_ZIP_URL}")
-    resp = requests.get(SEWER_ZIP_URL, timeout=120)
-    resp.raise_for_status()
-    SEWER_ZIP_PATH.write_bytes(resp.content)
+
+    # Stream to a .part file so the archive is never held in memory and
+    # an interrupted download can't be mistaken for a valid cache.
+    part_path = SEWER_ZIP_PATH.with_name(SEWER_ZIP_PATH.name + ".part")
+    with requests.get(SEWER_ZIP_URL, stream=True, timeout=120) as resp:
+        resp.raise_for_status()
+        etag = resp.headers.get("ETag")
+        with open(part_path, "wb") as f:
+            for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+    os.replace(part_path, SEWER_ZIP_PATH)
+
+    # Sidecar with the ETag this ZIP was downloaded under (also replaced
+    # atomically, so it never describes a different file)
+    meta_path = SEWER_ZIP_PATH.with_suffix(".json")
+    meta_part_path = meta_path.with_name(meta_path.name + ".part")
+    meta_part_path.write_text(json.dumps({"etag": etag}))
+    os.replace(meta_part_path, meta_path)
+
     print(f"[sso] Saved ZIP to: {SEWER_ZIP_PATH}")
     return SEWER_ZIP_PATH
 
 
+def _read_zip_csv(zip_path: Path, name: str) -> pd.DataFrame:
+    """
+    Read a single CSV member from the ZIP with pyarrow's CSV reader.
+
+    Tokenizing and conversion are multithreaded across blocks. Columns stay
+    Arrow-backed, and ISO timestamp columns (e.g. SSO_DATETIME_COLS) are
+    parsed during type inference. A timestamp column with unparseable
+    values stays text.
+
+    Opens its own ZipFile handle so it is safe to call from multiple threads.
+    """
+    with zipfile.ZipFile(zip_path, "r") as z, z.open(name) as f:
+        table = pa_csv.read_csv(
+            f,
+            read_options=pa_csv.ReadOptions(
+                use_threads=True, block_size=CSV_BLOCK_SIZE
+            ),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=ID_COLUMN_TYPES,
+                strings_can_be_null=True,
+            ),
+        )
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
 def load_sso_tables(force_download: bool = False) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Download (if needed) and extract:
@@ -74,15 +193,17 @@ def load_sso_tables(force_download: bool = False) -> Tuple[pd.DataFrame, pd.Data
             n for n in names if "sewer_overflow_bypass_event" in n.lower()
         )
 
-        print("[sso] Found tables in ZIP:")
-        print("   collection_system_permit ->", coll_name)
-        print("   sewer_overflow_bypass_event ->", sso_name)
+    print("[sso] Found tables in ZIP:")
+    print("   collection_system_permit ->", coll_name)
+    print("   sewer_overflow_bypass_event ->", sso_name)
 
-        with z.open(coll_name) as f:
-            df_coll = pd.read_csv(f, low_memory=False)
-
-        with z.open(sso_name) as f:
-            df_sso = pd.read_csv(f, low_memory=False)
+    # Parse both members concurrently: Arrow's CSV reader releases the GIL,
+    # and each thread opens its own ZipFile handle
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        fut_coll = ex.submit(_read_zip_csv, zip_path, coll_name)
+        fut_sso = ex.submit(_read_zip_csv, zip_path, sso_name)
+        df_coll = fut_coll.result()
+        df_sso = fut_sso.result()
 
     print("[sso] collection_system_permit shape:", df_coll.shape)
     print("[sso] sewer_overflow_bypass_event shape:", df_sso.shape)
@@ -93,6 +214,136 @@ def load_sso_tables(force_download: bool = False) -> Tuple[pd.DataFrame, pd.Data
 # =========================================================
 # 2. Merge + summary
 # =========================================================
+def _normalize_join_key(col: pd.Series) -> pd.Series:
+    """
+    Strip + upper-case an identifier column for joining.
+
+    Runs directly as pyarrow.compute kernels on the column's Arrow data
+    (cast to string first if the column was read as another type).
+    """
+    arr = pa.array(col)
+    if not pa.types.is_string(arr.type):
+        arr = pc.cast(arr, pa.string())
+    arr = pc.utf8_upper(pc.utf8_trim_whitespace(arr))
+    return pd.Series(pd.arrays.ArrowExtensionArray(arr), index=col.index)
+
+
+def _as_datetime(col: pd.Series) -> pd.Series:
+    """
+    Return a timestamp column as NumPy datetime64.
+
+    Columns parsed as timestamps at read time are only converted (no
+    re-parsing). Only a column left as text, because it held unparseable
+    values, goes through pd.to_datetime, which coerces those values to NaT.
+    """
+    dtype = col.dtype
+    if isinstance(dtype, pd.ArrowDtype) and pa.types.is_timestamp(dtype.pyarrow_dtype):
+        return col.astype(f"datetime64[{dtype.pyarrow_dtype.unit}]")
+    if pd.api.types.is_datetime64_dtype(dtype):
+        return col
+    return pd.to_datetime(col, errors="coerce")
+
+
+def _add_join_codes(df_coll: pd.DataFrame, df_sso: pd.DataFrame) -> None:
+    """
+    Add an int64 "_join_code" column to both frames identifying the
+    normalized (permit_identifier, collection_system_identifier) pair.
+
+    Keys are factorized over the concatenation of both frames so equal
+    pairs get equal codes, letting the merge hash integers instead of
+    strings. Missing identifiers get their own code (matching merge's
+    NaN == NaN behavior on the original string keys).
+    """
+    n_coll = len(df_coll)
+    codes = []
+    sizes = []
+    for key in ("permit_identifier", "collection_system_identifier"):
+        combined = pd.concat(
+            [_normalize_join_key(df_coll[key]), _normalize_join_key(df_sso[key])],
+            ignore_index=True,
+        )
+        key_codes, uniques = pd.factorize(combined, use_na_sentinel=False)
+        codes.append(key_codes.astype("int64"))
+        sizes.append(len(uniques))
+
+    join_codes = codes[0] * sizes[1] + codes[1]
+    df_coll["_join_code"] = join_codes[:n_coll]
+    df_sso["_join_code"] = join_codes[n_coll:]
+
+
+def _summarize_by_group(df: pd.DataFrame, group_cols: List[str]) -> pd.DataFrame:
+    """
+    Per-group distinct event count, total volume, first start and last end.
+
+    Equivalent to groupby(group_cols, dropna=False) with nunique / sum /
+    min / max, but computed from a single lexsort on integer key codes:
+    each group is then a contiguous run, reduced with ufunc.reduceat.
+    """
+    # Integer sort codes per key column, with missing values sorted last
+    # (the order groupby(dropna=False) gives)
+    key_codes = []
+    for col in group_cols:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            codes = df[col].cat.codes.to_numpy()
+            n_uniques = len(df[col].cat.categories)
+        else:
+            codes, uniques = pd.factorize(df[col], sort=True)
+            n_uniques = len(uniques)
+        key_codes.append(np.where(codes < 0, n_uniques, codes))
+
+    event_codes, _ = pd.factorize(df["sewer_overflow_bypass_event_key"])
+
+    # lexsort sorts by its last key first; event key is the innermost key
+    order = np.lexsort([event_codes] + key_codes[::-1])
+    event_s = event_codes[order]
+
+    # A group run starts wherever any key code changes
+    is_start = np.zeros(len(order), dtype=bool)
+    is_start[:1] = True
+    for codes in key_codes:
+        codes_s = codes[order]
+        is_start[1:] |= codes_s[1:] != codes_s[:-1]
+    offsets = np.flatnonzero(is_start)
+
+    # Distinct events: first row of each non-missing event key within a group
+    is_new_event = event_s >= 0
+    is_new_event[1:] &= (event_s[1:] != event_s[:-1]) | is_start[1:]
+
+    # Volume is summed by pandas over the (already sorted) integer group ids
+    # rather than np.add.reduceat: groupby's sum is compensated, and a plain
+    # running sum drifts in the last digits (e.g. 38424.600000000006)
+    group_ids = np.cumsum(is_start) - 1
+    volume = pd.Series(df["sso_volume_gal"].to_numpy(dtype="float64")[order])
+    total_volume = volume.groupby(group_ids, sort=False).sum().to_numpy()
+
+    # Datetimes as int64 ticks; NaT is the int64 minimum, so it is skipped by
+    # max as-is and swapped for the maximum to be skipped by min
+    nat = np.iinfo(np.int64).min
+    start = df["sso_start_dt"].to_numpy()
+    end = df["sso_end_dt"].to_numpy()
+    start_i8 = start.view("int64")[order]
+    start_i8 = np.where(start_i8 == nat, np.iinfo(np.int64).max, start_i8)
+    first = np.minimum.reduceat(start_i8, offsets)
+    first[first == np.iinfo(np.int64).max] = nat
+    last = np.maximum.reduceat(end.view("int64")[order], offsets)
+
+    first_rows = order[offsets]
+    return pd.DataFrame(
+        {
+            **{
+                col: df[col].take(first_rows).reset_index(drop=True)
+                for col in group_cols
+            },
+            "sso_event_count": np.add.reduceat(
+                is_new_event.astype("int64"), offsets
+            ),
+            "sso_total_volume_gal": total_volume,
+            "sso_first_event": first.view(start.dtype),
+            "sso_last_event": last.view(end.dtype),
+        }
+    )
+
+
 def merge_sso_with_collection_system(
     df_coll: pd.DataFrame, df_sso: pd.DataFrame
 ) -> Dict[str, pd.DataFrame]:
@@ -100,70 +351,62 @@ def merge_sso_with_collection_system(
     Merge sewer_overflow_bypass_event with collection_system_permit
     on (permit_identifier, collection_system_identifier).
 
+    Note: df_coll and df_sso are modified in place (join helper columns,
+    coordinate cleanup). Write any raw outputs before calling this.
+
     Returns a dict of:
-      - collection_system_permit_raw
-      - sewer_overflow_bypass_event_raw
       - sso_events_with_collection_system
       - sso_summary_by_permit_year
     """
 
-    # Keep raw copies
-    df_coll_raw = df_coll.copy()
-    df_sso_raw = df_sso.copy()
-
-    # Normalized join keys (robust to whitespace/case)
-    for frame in (df_coll, df_sso):
-        frame["_permit_join"] = (
-            frame["permit_identifier"].astype(str).str.strip().str.upper()
-        )
-
-    # collection_system_identifier exists in both tables
-    df_coll["_cs_join"] = (
-        df_coll["collection_system_identifier"].astype(str).str.strip().str.upper()
-    )
-    df_sso["_cs_join"] = (
-        df_sso["collection_system_identifier"].astype(str).str.strip().str.upper()
-    )
+    # Integer join key for (permit_identifier, collection_system_identifier)
+    _add_join_codes(df_coll, df_sso)
 
     # --------------------------------------------------
     # Coordinate cleanup (fix sign errors for US systems)
     # --------------------------------------------------
-    # Convert to numeric, coerce bad text to NaN
-    df_sso["latitude_measure"] = pd.to_numeric(
-        df_sso.get("latitude_measure"), errors="coerce"
+    # Convert to numeric, coerce bad text to NaN. Work on plain float64
+    # arrays so the sign flips below are in-place NumPy ops.
+    lat = pd.to_numeric(df_sso["latitude_measure"], errors="coerce").to_numpy(
+        dtype="float64", na_value=np.nan, copy=True
     )
-    df_sso["longitude_measure"] = pd.to_numeric(
-        df_sso.get("longitude_measure"), errors="coerce"
+    lon = pd.to_numeric(df_sso["longitude_measure"], errors="coerce").to_numpy(
+        dtype="float64", na_value=np.nan, copy=True
     )
 
     # 1) Rows with negative latitude (e.g. -41, 98) -> flip both
-    mask_both = df_sso["latitude_measure"] < 0
-    df_sso.loc[mask_both, ["latitude_measure", "longitude_measure"]] = (
-        -df_sso.loc[mask_both, ["latitude_measure", "longitude_measure"]]
-    )
+    mask_both = lat < 0
+    np.negative(lat, out=lat, where=mask_both)
+    np.negative(lon, out=lon, where=mask_both)
 
     # 2) Rows with plausible US mainland lat (>= 0) and positive lon 60–110 -> flip lon only
     #    (e.g. 40, 88 -> 40, -88). This will NOT touch Guam (lon ~144).
-    mask_lon_only = (
-        df_sso["latitude_measure"].ge(0)
-        & df_sso["longitude_measure"].between(60, 110)
-    )
-    df_sso.loc[mask_lon_only, "longitude_measure"] = -df_sso.loc[
-        mask_lon_only, "longitude_measure"
+    mask_lon_only = (lat >= 0) & (lon >= 60) & (lon <= 110)
+    np.negative(lon, out=lon, where=mask_lon_only)
+
+    df_sso["latitude_measure"] = lat
+    df_sso["longitude_measure"] = lon
+
+    # One collection system row per join key, so the merge can't fan out
+    # SSO events. Prefer the current report over superseded ones.
+    if "current_report_flag" in df_coll.columns:
+        df_coll = df_coll.sort_values(
+            "current_report_flag",
+            key=lambda s: s.eq("Y").fillna(False),
+            kind="stable",
+        )
+    df_coll = df_coll.drop_duplicates(subset="_join_code", keep="last")
+
+    # Event-level lookup: all SSO events, with collection system attributes
+    # appended. With a unique right-hand key this is a plain indexed lookup
+    # (one hash probe per event, then a take per column) rather than a merge.
+    # (reindex raises on duplicate labels, so the dedupe above is enforced.)
+    coll_attrs = df_coll.set_index("_join_code").reindex(df_sso["_join_code"])
+    coll_attrs.index = df_sso.index
+    coll_attrs.columns = [
+        f"{c}_coll" if c in df_sso.columns else c for c in coll_attrs.columns
     ]
-
-    # Event-level merge: all SSO events, with collection system attributes appended
-    df_merged = df_sso.merge(
-        df_coll,
-        how="left",
-        on=["_permit_join", "_cs_join"],
-        suffixes=("", "_coll"),
-    )
-
-    # Clean up join helper columns (but keep original identifiers)
-    df_merged = df_merged.drop(columns=["_permit_join", "_cs_join"])
-    df_coll_raw = df_coll_raw.drop(columns=["_permit_join", "_cs_join"], errors="ignore")
-    df_sso_raw = df_sso_raw.drop(columns=["_permit_join", "_cs_join"], errors="ignore")
+    df_merged = pd.concat([df_sso.drop(columns="_join_code"), coll_attrs], axis=1)
 
     # --------------------------------------------------
     # Standardize coordinates for ArcGIS Online
@@ -182,22 +425,29 @@ def merge_sso_with_collection_system(
     print("[sso] Merged events shape:", df_merged.shape)
 
     # ---- Build a simple per-permit/year summary ----
-    df_summary = df_merged.copy()
+    # Derive the summary inputs straight from df_merged's columns and
+    # assemble them in one frame, rather than copying the merged frame and
+    # adding helper columns to it.
 
-    # Convert datetimes / volume
-    df_summary["sso_start_dt"] = pd.to_datetime(
-        df_summary["sewer_overflow_bypass_start_datetime"], errors="coerce"
-    )
-    df_summary["sso_end_dt"] = pd.to_datetime(
-        df_summary["sewer_overflow_bypass_end_datetime"], errors="coerce"
-    )
+    # Datetimes were parsed at read time (see _as_datetime)
+    start_dt, end_dt = (_as_datetime(df_merged[col]) for col in SSO_DATETIME_COLS)
 
-    df_summary["sso_volume_gal"] = pd.to_numeric(
-        df_summary["sewer_overflow_bypass_discharge_volume_gallons"],
+    # (plain float64: coercing Arrow-backed strings can leave NaN alongside NA,
+    # which the sum below would not skip)
+    volume_gal = pd.to_numeric(
+        df_merged["sewer_overflow_bypass_discharge_volume_gallons"],
         errors="coerce",
+    ).astype("float64")
+
+    # Year via a NumPy datetime64[Y] cast rather than the .dt accessor;
+    # NaT starts become <NA> in a nullable integer column, so years are
+    # written as 2023 (not 2023.0) and NaT years as empty
+    start = start_dt.to_numpy(dtype="datetime64[s]", na_value=np.datetime64("NaT"))
+    years = pd.array(
+        start.astype("datetime64[Y]").astype("int64") + 1970,
+        dtype="Int64",
     )
-
-    df_summary["year"] = df_summary["sso_start_dt"].dt.year
+    years[np.isnat(start)] = pd.NA
 
     # Aggregate by permit + collection system + year
     summary_group_cols = [
@@ -209,29 +459,80 @@ def merge_sso_with_collection_system(
         "year",
     ]
 
-    sso_summary = (
-        df_summary.groupby(summary_group_cols, dropna=False)
-        .agg(
-            sso_event_count=("sewer_overflow_bypass_event_key", "nunique"),
-            sso_total_volume_gal=("sso_volume_gal", "sum"),
-            sso_first_event=("sso_start_dt", "min"),
-            sso_last_event=("sso_end_dt", "max"),
-        )
-        .reset_index()
+    # Repetitive string keys -> category: each column becomes small integer
+    # codes plus one copy of each distinct string, so the summary sorts and
+    # groups on codes and never carries per-row strings. The output key
+    # columns are decoded from the categories only for the grouped rows.
+    category_cols = (
+        "permit_identifier",
+        "collection_system_identifier",
+        "collection_system_name",
+        "collection_system_owner_type_desc",
     )
 
+    df_summary = pd.DataFrame(
+        {
+            **{col: df_merged[col].astype("category") for col in category_cols},
+            "collection_system_population": df_merged["collection_system_population"],
+            "year": years,
+            "sewer_overflow_bypass_event_key": df_merged[
+                "sewer_overflow_bypass_event_key"
+            ],
+            "sso_volume_gal": volume_gal,
+            "sso_start_dt": start_dt,
+            "sso_end_dt": end_dt,
+        },
+        index=df_merged.index,
+    )
+
+    sso_summary = _summarize_by_group(df_summary, summary_group_cols)
+
     print("[sso] Summary by permit/year shape:", sso_summary.shape)
 
     return {
-        "collection_system_permit_raw": df_coll_raw,
-        "sewer_overflow_bypass_event_raw": df_sso_raw,
         "sso_events_with_collection_system": df_merged,
         "sso_summary_by_permit_year": sso_summary,
     }
 
 
 # =========================================================
-# 3. Orchestration
+# 3. Output
+# =========================================================
+def write_outputs(frames: Dict[str, pd.DataFrame], fmt: str = "csv") -> None:
+    """
+    Write each frame to OUTPUT_DIR / "<name>.<fmt>" (fmt: "csv" or "parquet").
+
+    The files are independent, so they are written concurrently, one
+    thread per frame. Each file is written OUTPUT_CHUNK_ROWS rows at a time
+    (CSV chunks / Parquet row groups) to cap serialization memory.
+    """
+
+    def _write(name: str, df: pd.DataFrame) -> None:
+        path = OUTPUT_DIR / f"{name}.{fmt}"
+        if fmt == "parquet":
+            df.to_parquet(
+                path,
+                engine="pyarrow",
+                compression="zstd",
+                index=False,
+                row_group_size=OUTPUT_CHUNK_ROWS,
+            )
+        else:
+            df.to_csv(
+                path,
+                index=False,
+                chunksize=OUTPUT_CHUNK_ROWS,
+                lineterminator="\n",
+            )
+
+    with ThreadPoolExecutor(max_workers=len(frames)) as ex:
+        futures = [ex.submit(_write, name, df) for name, df in frames.items()]
+        for fut in futures:
+            fut.result()
+
+
+# =========================================================
+# 4. Orchestration
 # =========================================================
 def run_pipeline() -> None:
     print("=== EPA SSO / Collection System Pipeline: START ===")
@@ -239,26 +540,21 @@ def run_pipeline() -> None:
     # 1) Download + load tables
     df_coll, df_sso = load_sso_tables(force_download=False)
 
-    # 2) Merge + summarize
+    # 2) Write raw outputs (before the merge augments the frames in place).
+    #    These aren't published, so store them as compressed Parquet.
+    write_outputs(
+        {
+            "collection_system_permit_raw": df_coll,
+            "sewer_overflow_bypass_event_raw": df_sso,
+        },
+        fmt="parquet",
+    )
+
+    # 3) Merge + summarize
     results = merge_sso_with_collection_system(df_coll, df_sso)
 
-    # 3) Write outputs
-    results["collection_system_permit_raw"].to_csv(
-        OUTPUT_DIR / "collection_system_permit_raw.csv",
-        index=False,
-    )
-    results["sewer_overflow_bypass_event_raw"].to_csv(
-        OUTPUT_DIR / "sewer_overflow_bypass_event_raw.csv",
-        index=False,
-    )
-    results["sso_events_with_collection_system"].to_csv(
-        OUTPUT_DIR / "sso_events_with_collection_system.csv",
-        index=False,
-    )
-    results["sso_summary_by_permit_year"].to_csv(
-        OUTPUT_DIR / "sso_summary_by_permit_year.csv",
-        index=False,
-    )
+    # 4) Write merged outputs (CSV: copied to public_data by the workflow)
+    write_outputs(results, fmt="csv")
 
     print("=== EPA SSO / Collection System Pipeline: DONE ===")
     print(f"Outputs written to: {OUTPUT_DIR}")